@@ -1,17 +1,31 @@
+import base64
+import contextlib
+import functools
+import hashlib
+import json
+import pickle
 import sys
 from dataclasses import asdict
 from pathlib import Path
+from types import MappingProxyType
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import (
+    Qt, QAbstractTableModel, QModelIndex, QObject, QRunnable, QStringListModel,
+    QThreadPool, QTimer, Signal,
+)
 from PySide6.QtGui import QAction
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QSplitter, QListWidget, QListWidgetItem, QFormLayout, QLineEdit,
     QSpinBox, QPushButton, QTableWidget, QTableWidgetItem, QHeaderView,
-    QPlainTextEdit, QTabWidget, QFileDialog, QLabel, QMessageBox,
-    QDialog, QDialogButtonBox, QComboBox
+    QTableView, QPlainTextEdit, QTabWidget, QFileDialog, QLabel, QMessageBox,
+    QDialog, QDialogButtonBox, QComboBox, QProgressDialog
+)
+from sqlalchemy import (
+    create_engine, make_url, inspect, literal_column, select, text, tuple_,
+    MetaData, Table, Column, ForeignKeyConstraint, Index, PrimaryKeyConstraint,
+    LargeBinary, BINARY, VARBINARY,
 )
-from sqlalchemy import create_engine, MetaData
 
 # ---- HTNQL imports: adjust if your package differs ----
 from htnql.schema_graph import SchemaGraph
@@ -24,86 +38,433 @@ from htnql.shape_suggestion import ShapeIntent, suggest_shapes
 #  Session layer (no Qt here) – wraps HTNQL
 # ============================================================
 
+# url -> (file fingerprint, reflected MetaData), so reopening the same DB
+# skips reflection
+_REFLECTION_CACHE: dict[str, tuple[tuple[int, int] | None, MetaData]] = {}
+
+# QueuePool settings: LIFO keeps the few hot connections warm and lets idle
+# ones time out; pre-ping drops connections the server has closed
+_ENGINE_POOL_OPTIONS = {
+    "pool_use_lifo": True,
+    "pool_pre_ping": True,
+    "pool_size": 5,
+    "max_overflow": 10,
+}
+
+# on-disk copy of the above, reused across GUI sessions (SQLite files only)
+_REFLECTION_CACHE_DIR = Path.home() / ".cache" / "htnql" / "reflect"
+
+
+def _reflect_metadata(engine) -> MetaData:
+    """
+    Reflect the whole schema with SQLAlchemy 2.0's batched get_multi_* API.
+
+    MetaData.reflect() issues several metadata queries per table; here we do
+    one round-trip per category (columns, PKs, FKs, indexes, table options)
+    and build the Table objects from the returned {(schema, table): ...} dicts.
+    """
+    insp = inspect(engine)
+    cols = insp.get_multi_columns(schema=None)
+    pks = insp.get_multi_pk_constraint(schema=None)
+    fks = insp.get_multi_foreign_keys(schema=None)
+    indexes = insp.get_multi_indexes(schema=None)
+    options = insp.get_multi_table_options(schema=None)
+
+    md = MetaData()
+    for key, table_cols in cols.items():
+        schema, name = key
+        columns = []
+        for c in table_cols:
+            kwargs = {
+                "nullable": c.get("nullable", True),
+                "comment": c.get("comment"),
+            }
+            if c.get("default") is not None:
+                kwargs["server_default"] = text(c["default"])
+            if "autoincrement" in c:
+                kwargs["autoincrement"] = c["autoincrement"]
+            columns.append(Column(c["name"], c["type"], **kwargs))
+
+        constraints = []
+        pk = pks.get(key) or {}
+        if pk.get("constrained_columns"):
+            # constraint (not per-column) keeps the declared PK column order
+            constraints.append(PrimaryKeyConstraint(
+                *pk["constrained_columns"], name=pk.get("name"),
+            ))
+        for fk in fks.get(key, []):
+            ref_table = fk["referred_table"]
+            if fk.get("referred_schema"):
+                ref_table = f"{fk['referred_schema']}.{ref_table}"
+            constraints.append(ForeignKeyConstraint(
+                fk["constrained_columns"],
+                [f"{ref_table}.{rc}" for rc in fk["referred_columns"]],
+                name=fk.get("name"),
+            ))
+
+        table = Table(
+            name, md, *columns, *constraints,
+            schema=schema, extend_existing=True,
+            **options.get(key, {}),  # e.g. sqlite_with_rowid=False
+        )
+
+        for ix in indexes.get(key, []):
+            ix_cols = [table.c[cn] for cn in ix["column_names"] if cn in table.c]
+            if ix.get("name") and ix_cols:
+                Index(ix["name"], *ix_cols, unique=ix.get("unique", False))
+
+    return md
+
+
+def _create_engine(url: str):
+    u = make_url(url)
+    if u.get_backend_name() == "sqlite" and u.database in (None, "", ":memory:"):
+        # in-memory SQLite uses SingletonThreadPool, which takes none of these
+        return create_engine(url)
+    return create_engine(url, **_ENGINE_POOL_OPTIONS)
+
+
+def _sqlite_fingerprint(engine) -> tuple[int, int] | None:
+    """
+    (mtime_ns, schema_version) of the SQLite file behind engine, or None if
+    there isn't one.
+
+    The mtime alone misses DDL committed in WAL mode, which lands in the
+    -wal file and leaves the main file untouched; PRAGMA schema_version is
+    bumped by every schema change regardless of journal mode.
+    """
+    if engine.url.get_backend_name() != "sqlite":
+        return None
+    db = engine.url.database
+    if not db or db == ":memory:":
+        return None
+    try:
+        mtime = Path(db).stat().st_mtime_ns
+    except OSError:
+        return None
+    with engine.connect() as conn:
+        version = conn.exec_driver_sql("PRAGMA schema_version").scalar()
+    return mtime, version
+
+
+def _load_metadata(engine, url: str) -> MetaData:
+    """
+    Return reflected MetaData for engine, reusing the in-process or on-disk
+    cache when the file fingerprint recorded for url still matches.
+
+    Only file-backed SQLite databases are persisted to disk; for anything
+    else we have no cheap way to tell whether the schema changed.
+    """
+    fingerprint = _sqlite_fingerprint(engine)
+    cached = _REFLECTION_CACHE.get(url)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
+    md = None
+
+    cache_path = None
+    if fingerprint is not None:
+        # one file per URL holding (fingerprint, MetaData); a new fingerprint
+        # overwrites it, so writes to the DB don't pile up stale pickles
+        key = hashlib.blake2b(url.encode()).hexdigest()
+        cache_path = _REFLECTION_CACHE_DIR / f"{key}.pkl"
+        try:
+            with open(cache_path, "rb") as fh:
+                cached_fingerprint, cached_md = pickle.load(fh)
+            if cached_fingerprint == fingerprint:
+                md = cached_md
+        except FileNotFoundError:
+            pass
+        except Exception:
+            # stale or corrupt pickle (e.g. after a SQLAlchemy upgrade)
+            md = None
+
+    if md is None:
+        md = _reflect_metadata(engine)
+        if cache_path is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_suffix(".tmp")
+                with open(tmp_path, "wb") as fh:
+                    pickle.dump((fingerprint, md), fh, protocol=pickle.HIGHEST_PROTOCOL)
+                tmp_path.replace(cache_path)
+            except (OSError, pickle.PicklingError):
+                pass
+
+    _REFLECTION_CACHE[url] = (fingerprint, md)
+    return md
+
+
+# parsed specs keyed by their canonical JSON; bounded since every page
+# cursor produces a new key
+_SPEC_CACHE_SIZE = 256
+
+
+@functools.lru_cache(maxsize=1024, typed=True)
+def _metric_spec(expr: str, alias: str) -> MetricSpec:
+    return MetricSpec(expr=expr, alias=alias)
+
+
+@functools.lru_cache(maxsize=1024, typed=True)
+def _filter_spec(column: str, op: str, value) -> FilterSpec:
+    return FilterSpec(column=column, op=op, value=value)
+
+
+def _intern_filter(f: dict) -> FilterSpec:
+    try:
+        return _filter_spec(f["column"], f["op"], f["value"])
+    except TypeError:
+        # unhashable value (e.g. a list for IN): build a fresh one
+        return FilterSpec(**f)
+
+
+def _freeze(obj):
+    """Read-only view of an asdict() payload: dicts -> mappingproxy, lists -> tuple."""
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, (list, tuple)):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+# result column carrying SQLite's rowid when a table has no primary key;
+# used as the keyset cursor and stripped before rows reach the caller
+_ROWID_KEY = "_htnql_rowid"
+
+
+def _literal_safe(col, dialect) -> bool:
+    """
+    Whether col's values can be inlined as SQL literals that compare the same
+    way as the stored values. Binary keys can't: on SQLite a rendered BLOB
+    cursor is a text literal, which sorts below every BLOB.
+    """
+    if isinstance(col.type, (LargeBinary, BINARY, VARBINARY)):
+        return False
+    try:
+        return col.type.literal_processor(dialect) is not None
+    except NotImplementedError:
+        return False
+
+
+def _encode_cursor(values: tuple) -> str:
+    return base64.urlsafe_b64encode(pickle.dumps(values)).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> tuple:
+    # cursors are only ever produced by _encode_cursor in this process
+    return pickle.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+
+
 class HTNQLSession:
     """
     Thin wrapper around your HTNQL primitives.
 
-    - Reflects the DB via SQLAlchemy
+    - Reflects the DB via SQLAlchemy (batched, cached per URL + file fingerprint)
     - Builds SchemaGraph + QueryEngine
     - Exposes schema & query methods for the GUI
     """
     def __init__(self, url: str):
         self.url = url
-        self.engine = create_engine(url)
-        md = MetaData()
-        md.reflect(bind=self.engine)
+        self.engine = _create_engine(url)
+        md = _load_metadata(self.engine, url)
         self.schema_graph = SchemaGraph(md)
         self.qe = QueryEngine(self.engine, self.schema_graph)
+        # per-session memo: the schema is fixed for the session's lifetime,
+        # so the table name alone is a sufficient key
+        self._suggest_shapes_cached = functools.lru_cache(maxsize=256)(
+            self._suggest_shapes
+        )
+        self._spec_cache: dict[str, ReportSpec] = {}
+
+    def dispose(self):
+        """Close pooled connections; the engine opens new ones if used again."""
+        self.engine.dispose()
 
     # ---------- schema ----------
     def list_tables(self):
-        tables = []
-        for name, table in self.schema_graph.metadata.tables.items():
-            columns = []
-            for col in table.columns:
-                columns.append({
-                    "name": col.name,
-                    "type": str(col.type),
-                })
-            tables.append({"name": name, "columns": columns})
-        return tables
+        # columns are filled in on demand via get_columns_for_table()
+        return [{"name": name, "columns": None} for name in self.schema_graph.tables()]
 
     def get_columns_for_table(self, table: str):
         t = self.schema_graph.metadata.tables.get(table)
-        if not t:
+        if t is None:
             return []
         return [{"name": c.name, "type": str(c.type)} for c in t.columns]
 
     def suggest_shapes_for_table(self, table: str):
+        return list(self._suggest_shapes_cached(table))
+
+    def _suggest_shapes(self, table: str) -> tuple[MappingProxyType, ...]:
+        # frozen, since every caller shares the cached payloads
         intent = ShapeIntent(include_tables=[table])
         candidates = suggest_shapes(self.schema_graph, intent)
-        return [asdict(c) for c in candidates]
+        return tuple(_freeze(asdict(c)) for c in candidates)
 
     # ---------- running queries ----------
-    def run_report(self, spec_dict: dict):
+    def _paged_base_sql(self, table: str, page_size: int, cursor: str | None):
+        """
+        Keyset-paged SELECT over table, ordered by its primary key.
+
+        Returns (sql, key_columns). Fetches page_size + 1 rows so the caller
+        can tell whether another page exists. If the table has no primary key,
+        or one whose values can't be inlined as literals, SQLite rowid tables
+        are paged on their rowid (selected as _ROWID_KEY); otherwise there is
+        no usable sort key, so only the first page can be served.
+        """
+        t = self.schema_graph.metadata.tables[table]
+        dialect = self.engine.dialect
+        keys = list(t.primary_key.columns)
+        if not all(_literal_safe(c, dialect) for c in keys):
+            keys = []
+        key_names = [c.name for c in keys]
+        stmt = select(t)
+        if (
+            not keys
+            and dialect.name == "sqlite"
+            and t.dialect_options["sqlite"]["with_rowid"]
+            and "rowid" not in t.c
+        ):
+            rowid = literal_column("rowid")
+            stmt = select(t, rowid.label(_ROWID_KEY))
+            keys, key_names = [rowid], [_ROWID_KEY]
+        if keys:
+            stmt = stmt.order_by(*keys)
+            if cursor:
+                values = _decode_cursor(cursor)
+                if len(keys) == 1:
+                    stmt = stmt.where(keys[0] > values[0])
+                else:
+                    stmt = stmt.where(tuple_(*keys) > tuple_(*values))
+        stmt = stmt.limit(page_size + 1)
+        sql = str(stmt.compile(self.engine, compile_kwargs={"literal_binds": True}))
+        return sql, key_names
+
+    def _report_spec(self, args: dict) -> ReportSpec:
+        """
+        Build a ReportSpec from plain args, returning the same (interned)
+        instance when an identical spec was built before.
+        """
+        try:
+            key = json.dumps(args, sort_keys=True)
+        except TypeError:
+            key = None
+        if key is not None and key in self._spec_cache:
+            return self._spec_cache[key]
+
         spec = ReportSpec(
-            name=spec_dict.get("name", "ad_hoc"),
-            metrics=[MetricSpec(**m) for m in spec_dict["metrics"]],
-            group_by=spec_dict.get("group_by", []),
-            filters=[FilterSpec(**f) for f in spec_dict.get("filters", [])],
-            limit=spec_dict.get("limit"),
-            base_sql=spec_dict.get("base_sql"),
-            raw_sql=spec_dict.get("raw_sql"),
+            name=args["name"],
+            metrics=[_metric_spec(m["expr"], m["alias"]) for m in args["metrics"]],
+            group_by=list(args["group_by"]),
+            filters=[_intern_filter(f) for f in args["filters"]],
+            limit=args["limit"],
+            base_sql=args["base_sql"],
+            raw_sql=args["raw_sql"],
         )
 
+        if key is not None:
+            if len(self._spec_cache) >= _SPEC_CACHE_SIZE:
+                del self._spec_cache[next(iter(self._spec_cache))]
+            self._spec_cache[key] = spec
+        return spec
+
+    def run_report(self, spec_dict: dict):
+        base_sql = spec_dict.get("base_sql")
+        limit = spec_dict.get("limit")
+        page_size = spec_dict.get("page_size")
+        base_table = spec_dict.get("base_table")
+        key_columns = []
+        if page_size:
+            limit = page_size + 1
+            if base_table in self.schema_graph.metadata.tables:
+                base_sql, key_columns = self._paged_base_sql(
+                    base_table, page_size, spec_dict.get("cursor")
+                )
+
+        spec = self._report_spec({
+            "name": spec_dict.get("name", "ad_hoc"),
+            "metrics": spec_dict["metrics"],
+            "group_by": spec_dict.get("group_by", []),
+            "filters": spec_dict.get("filters", []),
+            "limit": limit,
+            "base_sql": base_sql,
+            "raw_sql": spec_dict.get("raw_sql"),
+        })
+
         rows, trace = self.qe.run_report_with_trace(spec)
 
-        rows_list = []
+        # dispatch on the row type once, not per row
         headers = None
-
-        for r in rows:
-            # Case 1: dict-like row
-            if isinstance(r, dict):
-                if headers is None:
-                    headers = list(r.keys())
-                rows_list.append(list(r.values()))
-            else:
-                # Case 2: SQLAlchemy Row / namedtuple-like
-                if headers is None and hasattr(r, "keys"):
-                    try:
-                        headers = list(r.keys())
-                    except TypeError:
-                        headers = None
-                rows_list.append(list(r))
+        first = rows[0] if rows else None
+        if isinstance(first, dict):
+            # Case 1: dict rows (what ExecutePlannedSql produces)
+            headers = list(first.keys())
+            rows_list = [list(r.values()) for r in rows]
+        else:
+            # Case 2: SQLAlchemy Row / namedtuple-like / plain sequence
+            if hasattr(first, "_mapping"):
+                headers = list(first._mapping.keys())
+            elif hasattr(first, "_fields"):
+                headers = list(first._fields)
+            rows_list = [list(r) for r in rows]
+
+        next_cursor = None
+        has_more = bool(page_size) and len(rows_list) > page_size
+        if has_more:
+            rows_list = rows_list[:page_size]
+            if key_columns and headers:
+                last = rows_list[-1]
+                next_cursor = _encode_cursor(
+                    tuple(last[headers.index(k)] for k in key_columns)
+                )
+
+        if headers and _ROWID_KEY in headers:
+            i = headers.index(_ROWID_KEY)
+            headers = headers[:i] + headers[i + 1:]
+            rows_list = [r[:i] + r[i + 1:] for r in rows_list]
 
         return {
             "rows": rows_list,
             "headers": headers,
             "trace": [str(step) for step in trace],
+            "next_cursor": next_cursor,
+            # True even without a cursor: the page was cut at page_size
+            "has_more": has_more,
         }
 
 
 
+# ============================================================
+#  Background work (keeps DB I/O off the GUI thread)
+# ============================================================
+
+class _TaskSignals(QObject):
+    finished = Signal(object)
+    failed = Signal(str)
+
+
+class BackgroundTask(QRunnable):
+    """
+    Runs fn(*args) on the global QThreadPool.
+
+    The result (or the error message) comes back through `signals`, which
+    lives on the GUI thread, so connected slots run there and may touch
+    widgets.
+    """
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = _TaskSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
+
 # ============================================================
 #  Connection dialog (SQLite for now)
 # ============================================================
@@ -173,6 +534,8 @@ class SchemaBrowser(QWidget):
     Shows list of tables. Clicking one emits a signal by calling a handler
     set from MainWindow (to avoid custom signals for simplicity).
     """
+    DEBOUNCE_MS = 120
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.list = QListWidget()
@@ -184,25 +547,65 @@ class SchemaBrowser(QWidget):
         # callback set by MainWindow
         self.on_table_selected = None
 
+        # Clicking or arrowing through tables quickly would rebuild the query
+        # builder for every table passed; only the one the user settles on
+        # (no new selection for DEBOUNCE_MS) is reported.
+        self._pending_table = None
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(self.DEBOUNCE_MS)
+        self._debounce.timeout.connect(self._fire_pending)
+
         self.list.itemClicked.connect(self._item_clicked)
+        self.list.currentItemChanged.connect(self._item_clicked)
 
     def set_schema(self, tables):
+        self._debounce.stop()
+        self._pending_table = None
         self.list.clear()
         for t in tables:
             item = QListWidgetItem(t["name"])
-            item.setData(Qt.UserRole, t)
+            # name only; MainWindow loads columns when the table is clicked
+            item.setData(Qt.UserRole, {"name": t["name"]})
             self.list.addItem(item)
 
-    def _item_clicked(self, item: QListWidgetItem):
+    def _item_clicked(self, item: QListWidgetItem, *_):
+        if item is None:
+            return
         data = item.data(Qt.UserRole)
-        if self.on_table_selected:
-            self.on_table_selected(data["name"], data["columns"])
+        self._pending_table = data["name"]
+        self._debounce.start()  # restarts if already running
+
+    def _fire_pending(self):
+        name, self._pending_table = self._pending_table, None
+        if name and self.on_table_selected:
+            self.on_table_selected(name, None)
 
 
 # ============================================================
 #  Query builder (right-top panel)
 # ============================================================
 
+@contextlib.contextmanager
+def _frozen(table: QTableWidget):
+    """
+    Bulk-edit a QTableWidget without per-row repaints, item/cell signals or
+    header resizes; everything is restored (and laid out once) on exit.
+    """
+    header = table.horizontalHeader()
+    modes = [header.sectionResizeMode(i) for i in range(header.count())]
+    blocked = table.blockSignals(True)
+    table.setUpdatesEnabled(False)
+    header.setSectionResizeMode(QHeaderView.Fixed)
+    try:
+        yield table
+    finally:
+        for i, mode in enumerate(modes):
+            header.setSectionResizeMode(i, mode)
+        table.setUpdatesEnabled(True)
+        table.blockSignals(blocked)
+
+
 class QueryBuilder(QWidget):
     """
     Visual builder for a ReportSpec subset:
@@ -211,15 +614,21 @@ class QueryBuilder(QWidget):
     - Metrics: a small table of expression + alias
     - Group by: list of columns with checkboxes
     - Filters: table of column/op/value
-    - Limit
+    - Page size (results are fetched one keyset page at a time)
     - Optional shape suggestions (combo)
     """
+    FILTER_OPS = ["=", "!=", "<", "<=", ">", ">=", "LIKE", "IN", "BETWEEN"]
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
         # state
         self._current_table = None
         self._current_columns = []  # list of dicts {name, type}
+
+        # shared by every filter row's combos instead of per-row addItem()s
+        self._columns_model = QStringListModel(self)
+        self._ops_model = QStringListModel(self.FILTER_OPS, self)
         self._current_shapes = []   # list of dicts from suggest_shapes
 
         # --- top: base table + shape suggestions ---
@@ -281,15 +690,15 @@ class QueryBuilder(QWidget):
         filters_btn_row.addWidget(self.remove_filter_btn)
         filters_layout.addLayout(filters_btn_row)
 
-        # --- bottom: limit + run ---
-        self.limit_spin = QSpinBox()
-        self.limit_spin.setRange(1, 1_000_000)
-        self.limit_spin.setValue(1000)
+        # --- bottom: page size + run ---
+        self.page_size_spin = QSpinBox()
+        self.page_size_spin.setRange(1, 100_000)
+        self.page_size_spin.setValue(1000)
 
         self.run_btn = QPushButton("Run")
 
         bottom_form = QFormLayout()
-        bottom_form.addRow("Limit:", self.limit_spin)
+        bottom_form.addRow("Page size:", self.page_size_spin)
         bottom_form.addRow("", self.run_btn)
 
         # --- compose ---
@@ -313,24 +722,29 @@ class QueryBuilder(QWidget):
     def set_table_and_columns(self, table_name: str, columns: list[dict]):
         self._current_table = table_name
         self._current_columns = columns
+        self._columns_model.setStringList([c["name"] for c in columns])
         self.base_table_edit.setText(table_name)
 
-        # reset group_by table
-        self.group_by_table.setRowCount(0)
-        for col in columns:
-            row = self.group_by_table.rowCount()
-            self.group_by_table.insertRow(row)
-
-            # checkbox in column 0
-            cb_item = QTableWidgetItem()
-            cb_item.setFlags(cb_item.flags() | Qt.ItemIsUserCheckable)
-            cb_item.setCheckState(Qt.Unchecked)
-            self.group_by_table.setItem(row, 0, cb_item)
-
-            # name in column 1
-            name_item = QTableWidgetItem(col["name"])
-            name_item.setFlags(name_item.flags() & ~Qt.ItemIsEditable)
-            self.group_by_table.setItem(row, 1, name_item)
+        # reuse existing group_by rows; only create items for added rows
+        with _frozen(self.group_by_table):
+            n_old = self.group_by_table.rowCount()
+            self.group_by_table.setRowCount(len(columns))
+            for row, col in enumerate(columns):
+                if row < n_old:
+                    self.group_by_table.item(row, 0).setCheckState(Qt.Unchecked)
+                    self.group_by_table.item(row, 1).setText(col["name"])
+                    continue
+
+                # checkbox in column 0
+                cb_item = QTableWidgetItem()
+                cb_item.setFlags(cb_item.flags() | Qt.ItemIsUserCheckable)
+                cb_item.setCheckState(Qt.Unchecked)
+                self.group_by_table.setItem(row, 0, cb_item)
+
+                # name in column 1
+                name_item = QTableWidgetItem(col["name"])
+                name_item.setFlags(name_item.flags() & ~Qt.ItemIsEditable)
+                self.group_by_table.setItem(row, 1, name_item)
 
         # reset filters (column combobox options)
         self.filters_table.setRowCount(0)
@@ -351,7 +765,7 @@ class QueryBuilder(QWidget):
     # --------------------------------------------------------
     def set_shapes(self, shapes: list[dict]):
         """
-        shapes come from HTNQL's suggest_shapes, already as dicts.
+        shapes come from HTNQL's suggest_shapes, as read-only mappings.
         We only show 'description' in the UI.
         """
         self._current_shapes = shapes
@@ -404,13 +818,12 @@ class QueryBuilder(QWidget):
 
         # Column combobox
         col_combo = QComboBox()
-        for col in self._current_columns:
-            col_combo.addItem(col["name"])
+        col_combo.setModel(self._columns_model)
         self.filters_table.setCellWidget(row, 0, col_combo)
 
         # Op combobox
         op_combo = QComboBox()
-        op_combo.addItems(["=", "!=", "<", "<=", ">", ">=", "LIKE", "IN", "BETWEEN"])
+        op_combo.setModel(self._ops_model)
         self.filters_table.setCellWidget(row, 1, op_combo)
 
         # Value as plain text
@@ -430,6 +843,8 @@ class QueryBuilder(QWidget):
         base_sql = None
         if base_table:
             base_sql = f"SELECT * FROM {base_table}"
+        # qualify columns with the table if we have one
+        prefix = f"{base_table}." if base_table else ""
 
         # metrics
         metrics = []
@@ -453,11 +868,7 @@ class QueryBuilder(QWidget):
             if cb_item and cb_item.checkState() == Qt.Checked and name_item:
                 col_name = name_item.text().strip()
                 if col_name:
-                    # Qualify with table if we have one
-                    if base_table:
-                        group_by.append(f"{base_table}.{col_name}")
-                    else:
-                        group_by.append(col_name)
+                    group_by.append(prefix + col_name)
 
         # filters
         filters = []
@@ -476,7 +887,7 @@ class QueryBuilder(QWidget):
             if col_name and op and val:
                 # You can add type handling here (ints/dates etc.).
                 filters.append({
-                    "column": f"{base_table}.{col_name}" if base_table else col_name,
+                    "column": prefix + col_name,
                     "op": op,
                     "value": val,
                 })
@@ -486,8 +897,10 @@ class QueryBuilder(QWidget):
             "metrics": metrics,
             "group_by": group_by,
             "filters": filters,
-            "limit": self.limit_spin.value(),
+            "base_table": base_table or None,
             "base_sql": base_sql,
+            "page_size": self.page_size_spin.value(),
+            "cursor": None,  # set by MainWindow when fetching the next page
         }
         return spec_dict
 
@@ -496,42 +909,113 @@ class QueryBuilder(QWidget):
 #  Results panel (right-bottom)
 # ============================================================
 
+# values Qt can display straight from a QVariant, no Python str() needed.
+# Numbers are not among them: the default delegate rounds floats to 6
+# significant digits and adds locale group separators to ints.
+_RAW_TYPES = (str,)
+
+
+def _raw_or_str(val):
+    # columns are only typed by their first row; SQLite may mix types
+    return val if type(val) in _RAW_TYPES else str(val)
+
+
+def _choose_fmt(t):
+    """Per-column display formatter, picked once from the first row's type."""
+    if t in _RAW_TYPES or t is type(None):
+        return _raw_or_str
+    return str
+
+
+class RowsModel(QAbstractTableModel):
+    """
+    Read-only table model over a list of row sequences.
+
+    Unlike QTableWidget, nothing is created per cell: the view asks for
+    the cells it is about to paint and we answer straight from the rows.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._headers = []
+        self._fmts = []
+
+    def set_rows(self, rows, headers=None):
+        self.beginResetModel()
+        self._rows = rows or []
+        n_cols = len(self._rows[0]) if self._rows else 0
+        self._headers = list(headers) if headers and len(headers) == n_cols else []
+        first = self._rows[0] if self._rows else ()
+        self._fmts = [_choose_fmt(type(v)) for v in first]
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid() or not self._rows:
+            return 0
+        return len(self._rows[0])
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        val = self._rows[index.row()][index.column()]
+        if val is None:
+            return None
+        return self._fmts[index.column()](val)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal and section < len(self._headers):
+            return str(self._headers[section])
+        return str(section + 1)
+
+
 class ResultView(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.table = QTableWidget()
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.model = RowsModel(self)
+        self.view = QTableView()
+        self.view.setModel(self.model)
+        self.view.setEditTriggers(QTableView.NoEditTriggers)
+        self.view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
 
         self.debug_text = QPlainTextEdit()
         self.debug_text.setReadOnly(True)
 
         tabs = QTabWidget()
-        tabs.addTab(self.table, "Results")
+        tabs.addTab(self.view, "Results")
         tabs.addTab(self.debug_text, "Plan / Debug")
 
+        self.page_label = QLabel("")
+        self.next_page_btn = QPushButton("Next page")
+        self.next_page_btn.setEnabled(False)
+
+        paging_row = QHBoxLayout()
+        paging_row.addWidget(self.page_label)
+        paging_row.addStretch(1)
+        paging_row.addWidget(self.next_page_btn)
+
         layout = QVBoxLayout(self)
         layout.addWidget(tabs)
+        layout.addLayout(paging_row)
 
     def set_rows(self, rows, headers=None):
-        self.table.clear()
-        if not rows:
-            self.table.setRowCount(0)
-            self.table.setColumnCount(0)
-            return
-
-        n_rows = len(rows)
-        n_cols = len(rows[0])
-        self.table.setRowCount(n_rows)
-        self.table.setColumnCount(n_cols)
-
-        if headers and len(headers) == n_cols:
-            self.table.setHorizontalHeaderLabels(headers)
-
-        for i, row in enumerate(rows):
-            for j, val in enumerate(row):
-                item = QTableWidgetItem(str(val))
-                self.table.setItem(i, j, item)
+        self.model.set_rows(rows, headers)
+
+    def set_page(self, page: int, n_rows: int, has_next: bool, has_more: bool = False):
+        if page <= 0:
+            self.page_label.setText("")
+        elif has_more and not has_next:
+            # cut at page_size, but the table has no key to page on
+            self.page_label.setText(
+                f"Page {page} (first {n_rows} rows; more rows not shown)"
+            )
+        else:
+            self.page_label.setText(f"Page {page} ({n_rows} rows)")
+        self.next_page_btn.setEnabled(has_next)
 
     def set_debug_text(self, text: str):
         self.debug_text.setPlainText(text)
@@ -549,6 +1033,16 @@ class MainWindow(QMainWindow):
 
         self.session: HTNQLSession | None = None
         self._tables_cache = []  # list from session.list_tables()
+        self._columns_cache: dict[str, list] = {}  # tables clicked so far
+        self._last_selected_table: str | None = None
+
+        # keyset paging state for the last Run
+        self._last_spec: dict | None = None
+        self._next_cursor: str | None = None
+        self._page = 0
+
+        # tasks in flight; holding them keeps their signal objects alive
+        self._tasks: set[BackgroundTask] = set()
 
         # Widgets
         self.schema_browser = SchemaBrowser()
@@ -581,6 +1075,7 @@ class MainWindow(QMainWindow):
 
         # Signals
         self.query_builder.run_btn.clicked.connect(self.on_run_clicked)
+        self.result_view.next_page_btn.clicked.connect(self.on_next_page_clicked)
 
         self.statusBar().showMessage("No database connected")
 
@@ -607,15 +1102,45 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Missing info", "Please select a database.")
             return
 
-        try:
-            session = HTNQLSession(url)
-        except Exception as e:
-            QMessageBox.critical(self, "Connection error", str(e))
-            return
-
-        self.session = session
-        self.statusBar().showMessage(f"Connected to {url}", 5000)
-        self.load_schema()
+        self.connect_to(url)
+
+    def connect_to(self, url: str):
+        """Reflect url on a worker thread behind a cancellable progress dialog."""
+        progress = QProgressDialog("Reflecting schema…", "Cancel", 0, 0, self)
+        progress.setWindowTitle("Connecting")
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(0)
+
+        task = BackgroundTask(HTNQLSession, url)
+
+        def on_done(session):
+            self._tasks.discard(task)
+            if progress.wasCanceled():
+                # the worker can't be interrupted; just drop what it built
+                session.dispose()
+                return
+            progress.close()
+            if self.session is not None:
+                self.session.dispose()
+            self.session = session
+            self.statusBar().showMessage(f"Connected to {url}", 5000)
+            self.load_schema()
+
+        def on_failed(message: str):
+            self._tasks.discard(task)
+            if progress.wasCanceled():
+                return
+            progress.close()
+            QMessageBox.critical(self, "Connection error", message)
+
+        task.signals.finished.connect(on_done)
+        task.signals.failed.connect(on_failed)
+        self._start_task(task)
+        progress.show()
+
+    def _start_task(self, task: BackgroundTask):
+        self._tasks.add(task)
+        QThreadPool.globalInstance().start(task)
 
     def load_schema(self):
         if not self.session:
@@ -626,10 +1151,34 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Schema error", str(e))
             return
         self._tables_cache = tables
+        self._columns_cache = {}
+        self._last_selected_table = None
+        # a previous DB's spec/cursor must not be paged against this session
+        self._last_spec = None
+        self._next_cursor = None
+        self._page = 0
+        self.result_view.set_page(0, 0, False)
         self.schema_browser.set_schema(tables)
 
+    def load_columns(self, table_name: str) -> list[dict]:
+        if not self.session:
+            return []
+        columns = self._columns_cache.get(table_name)
+        if columns is None:
+            columns = self.session.get_columns_for_table(table_name)
+            self._columns_cache[table_name] = columns
+        return columns
+
     # ---------- Schema selection ----------
-    def on_table_selected(self, table_name: str, columns: list[dict]):
+    def on_table_selected(self, table_name: str, columns: list[dict] | None = None):
+        # re-selecting the current table would only rebuild the same builder
+        # state (and throw away the user's group-by/filter choices)
+        if table_name == self._last_selected_table:
+            return
+        self._last_selected_table = table_name
+
+        if columns is None:
+            columns = self.load_columns(table_name)
         self.query_builder.set_table_and_columns(table_name, columns)
 
         # ask session for shape suggestions
@@ -646,13 +1195,57 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "No DB", "Please connect to a database first.")
             return
 
-        spec = self.query_builder.build_spec_dict()
+        self._last_spec = self.query_builder.build_spec_dict()
+        self._page = 0
+        self._run_spec(self._last_spec)
 
-        result = self.session.run_report(spec)
+    def on_next_page_clicked(self):
+        if not self.session or not self._last_spec or not self._next_cursor:
+            return
+        self._run_spec(dict(self._last_spec, cursor=self._next_cursor))
+
+    def _run_spec(self, spec: dict):
+        session = self.session
+        task = BackgroundTask(session.run_report, spec)
+
+        # a reconnect while the query runs makes its result stale: drop it
+        def on_done(result):
+            self._tasks.discard(task)
+            self._set_running(False)
+            if self.session is session:
+                self._show_result(result)
+
+        def on_failed(message: str):
+            self._tasks.discard(task)
+            self._set_running(False)
+            if self.session is session:
+                QMessageBox.critical(self, "Query error", message)
+
+        task.signals.finished.connect(on_done)
+        task.signals.failed.connect(on_failed)
+        self._set_running(True)
+        self._start_task(task)
+
+    def _set_running(self, running: bool):
+        self.query_builder.run_btn.setEnabled(not running)
+        if running:
+            self.result_view.next_page_btn.setEnabled(False)
+            self.statusBar().showMessage("Running query…")
+        else:
+            self.statusBar().clearMessage()
+
+    def _show_result(self, result: dict):
         rows = result["rows"]
         headers = result.get("headers")
         self.result_view.set_rows(rows, headers=headers)
 
+        self._next_cursor = result.get("next_cursor")
+        self._page += 1
+        self.result_view.set_page(
+            self._page, len(rows), self._next_cursor is not None,
+            result.get("has_more", False),
+        )
+
         debug_text = "Trace:\n" + "\n".join(result["trace"])
         self.result_view.set_debug_text(debug_text)
 